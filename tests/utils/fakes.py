@@ -0,0 +1,17 @@
+"""
+Lightweight test doubles for HTTP responses
+"""
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Minimal stand-in for requests.Response exposing status_code and json()"""
+    
+    status_code: int
+    _payload: Dict[str, Any]
+    
+    def json(self) -> Dict[str, Any]:
+        """Return the canned response payload"""
+        return self._payload
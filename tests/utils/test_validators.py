@@ -0,0 +1,252 @@
+"""
+Unit Tests - DataValidator
+Tests for the required-field, type and format checks in tests/utils/validators.py
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.utils.validators import DataValidator
+
+_VALID_CHART = {
+    "chart_id": "CHT001",
+    "patient_id": "PAT001",
+    "visit_date": "2024-01-15",
+    "provider": "Dr. Smith",
+    "chief_complaint": "Chest pain",
+    "vital_signs": {
+        "blood_pressure": "120/80",
+        "heart_rate": 72,
+        "temperature": 98.6
+    },
+    "diagnosis": ["I10", "E11.9"],
+    "medications": [
+        {"name": "lisinopril", "dosage": "10mg", "frequency": "daily"},
+        {"name": "metformin"}
+    ]
+}
+
+_VALID_PATIENT = {
+    "patient_id": "PAT001",
+    "first_name": "Jane",
+    "last_name": "Doe",
+    "date_of_birth": "1980-05-17",
+    "ssn": "***-**-1234",
+    "medical_record_number": "MRN123456",
+    "email": "jane.doe@example.com",
+    "address": {"street": "1 Main St", "city": "Austin", "state": "TX", "zip": "73301"}
+}
+
+# Has errors in every category; the first of each is noted inline
+_INVALID_CHART = {
+    "chart_id": "CHART-1",                  # first format error
+    "visit_date": "yesterday",
+    "vital_signs": {"heart_rate": "72"},    # first type error
+    "diagnosis": [None],
+}   # missing patient_id (first required error), provider, chief_complaint
+
+
+class TestDataValidator:
+    """Test cases for DataValidator's field-level checks"""
+
+    def test_valid_data_has_no_errors(self, data_validator):
+        """A schema-conforming chart produces no errors in any category"""
+        assert data_validator.validate_all(_VALID_CHART, "medical_chart.json") == {
+            "required": [], "types": [], "format": []
+        }
+
+    def test_relative_schema_path_shares_cached_validator(self, data_validator):
+        """A relative schema directory resolves to the same cache entry as the absolute default"""
+        relative = DataValidator(Path(os.path.relpath(data_validator.schema_path)))
+
+        assert relative.get_validator("claims_data.json") is data_validator.get_validator("claims_data.json")
+
+    def test_missing_required_fields_in_schema_order(self, data_validator):
+        """Missing top-level fields are reported in the order the schema lists them"""
+        data = {k: v for k, v in _VALID_CHART.items() if k not in ("chart_id", "provider")}
+
+        assert data_validator.validate_required_fields(data, "medical_chart.json") == (False, ["chart_id", "provider"])
+
+    def test_nested_object_type_error(self, data_validator):
+        """Properties of nested objects are checked with a dotted path"""
+        data = {**_VALID_CHART, "vital_signs": {"heart_rate": 72.5, "blood_pressure": 120}}
+
+        is_valid, errors = data_validator.validate_data_types(data, "medical_chart.json")
+
+        assert not is_valid
+        assert errors == [
+            "Type mismatch at vital_signs.heart_rate: expected integer, got float",
+            "Type mismatch at vital_signs.blood_pressure: expected string, got int",
+        ]
+
+    @pytest.mark.parametrize("vital_signs, expected_errors", [
+        pytest.param({"heart_rate": True},
+                     ["Type mismatch at vital_signs.heart_rate: expected integer, got bool"], id="bool_integer"),
+        pytest.param({"temperature": False},
+                     ["Type mismatch at vital_signs.temperature: expected number (int/float), got bool"], id="bool_number"),
+        pytest.param({"heart_rate": 72, "temperature": 98}, [], id="int_number"),
+    ])
+    def test_bool_is_not_integer_or_number(self, data_validator, vital_signs, expected_errors):
+        """bool is rejected for integer/number fields even though it subclasses int"""
+        data = {**_VALID_CHART, "vital_signs": vital_signs}
+
+        assert data_validator.validate_data_types(data, "medical_chart.json")[1] == expected_errors
+
+    def test_array_of_scalars_type_error(self, data_validator):
+        """Each item of a scalar array is checked against the items schema"""
+        data = {**_VALID_CHART, "diagnosis": ["I10", 42]}
+
+        assert data_validator.validate_data_types(data, "medical_chart.json") == (
+            False, ["Type mismatch at diagnosis[1]: expected string, got int"]
+        )
+
+    def test_array_of_objects_type_errors(self, data_validator):
+        """Object array items are type-checked themselves and descended into when they are dicts"""
+        data = {**_VALID_CHART, "medications": ["aspirin", {"name": "metformin", "dosage": 500}, 5]}
+
+        is_valid, errors = data_validator.validate_data_types(data, "medical_chart.json")
+
+        assert not is_valid
+        assert errors == [
+            "Type mismatch at medications[0]: expected object, got str",
+            "Type mismatch at medications[1].dosage: expected string, got int",
+            "Type mismatch at medications[2]: expected object, got int",
+        ]
+        # The full JSON Schema check agrees the data is invalid
+        assert not data_validator.validate_data(data, "medical_chart.json")[0]
+
+    def test_pattern_date_and_email_errors(self, data_validator):
+        """Pattern, date and email errors are reported in document order with the previous messages"""
+        data = {
+            **_VALID_PATIENT,
+            "date_of_birth": "05/17/1980",
+            "email": "not-an-email",
+            "address": {**_VALID_PATIENT["address"], "state": "tx"},
+        }
+
+        is_valid, errors = data_validator.validate_format(data, "patient_record.json")
+
+        assert not is_valid
+        assert errors == [
+            "Format error at date_of_birth: value '05/17/1980' does not match pattern '^[0-9]{4}-[0-9]{2}-[0-9]{2}$'",
+            "Date format error at date_of_birth: expected YYYY-MM-DD, got '05/17/1980'",
+            "Email format error at email: invalid email format 'not-an-email'",
+            "Format error at address.state: value 'tx' does not match pattern '^[A-Z]{2}$'",
+        ]
+
+    def test_validate_all_matches_individual_checks(self, data_validator):
+        """validate_all groups exactly what the per-category methods report"""
+        result = data_validator.validate_all(_INVALID_CHART, "medical_chart.json")
+
+        assert result["required"] == data_validator.validate_required_fields(_INVALID_CHART, "medical_chart.json")[1]
+        assert result["types"] == data_validator.validate_data_types(_INVALID_CHART, "medical_chart.json")[1]
+        assert result["format"] == data_validator.validate_format(_INVALID_CHART, "medical_chart.json")[1]
+        assert result["required"] == ["patient_id", "provider", "chief_complaint"]
+        assert len(result["types"]) == 2
+        assert len(result["format"]) == 3
+
+    @pytest.mark.parametrize("data, expected_errors", [
+        pytest.param({"note": None, "code": None}, [], id="null"),
+        pytest.param({"code": "A1"}, [], id="union_string"),
+        pytest.param({"code": 7}, ["Type mismatch at code: expected string or null, got int"], id="union_mismatch"),
+        pytest.param({"note": "text"}, ["Type mismatch at note: expected null, got str"], id="null_mismatch"),
+    ])
+    def test_null_and_union_types(self, tmp_path, data, expected_errors):
+        """'null' and union (list-valued) types are checked the same way validate_data checks them"""
+        schema = {
+            "type": "object",
+            "properties": {
+                "note": {"type": "null"},
+                "code": {"type": ["string", "null"]},
+            },
+        }
+        (tmp_path / "nullable.json").write_text(json.dumps(schema))
+        validator = DataValidator(tmp_path)
+
+        assert validator.validate_data_types(data, "nullable.json") == (not expected_errors, expected_errors)
+        assert validator.validate_all(data, "nullable.json")["types"] == expected_errors
+        assert validator.validate_data(data, "nullable.json")[0] == (not expected_errors)
+
+
+    @pytest.mark.parametrize("schema_name, data, expected_fields", [
+        pytest.param("claims_data.json", [1, 2], {""}, id="root_type_error"),
+        pytest.param("patient_record.json", {**_VALID_PATIENT, "address": {**_VALID_PATIENT["address"], "zip": 123}},
+                     {"address.zip"}, id="nested_field"),
+    ])
+    def test_failing_fields_are_paths(self, data_validator, schema_name, data, expected_fields):
+        """failing_fields holds dotted field paths, with "" for the root, never schema keywords like 'type'"""
+        is_valid, _, failing_fields = data_validator.validate_data(data, schema_name)
+
+        assert not is_valid
+        assert failing_fields == expected_fields
+
+class TestDataValidatorIsValid:
+    """Test cases for is_valid, the pass/fail-only schema check"""
+
+    def test_valid_payload(self, data_validator):
+        """A schema-conforming payload is valid"""
+        assert data_validator.is_valid(_VALID_CHART, "medical_chart.json")
+
+    def test_invalid_payload(self, data_validator):
+        """is_valid agrees with validate_data on an invalid payload"""
+        assert not data_validator.is_valid(_INVALID_CHART, "medical_chart.json")
+        assert not data_validator.validate_data(_INVALID_CHART, "medical_chart.json")[0]
+
+    def test_missing_schema_is_invalid(self, data_validator):
+        """A schema that cannot be loaded yields False rather than raising, like validate_data"""
+        assert not data_validator.is_valid(_VALID_CHART, "no_such_schema.json")
+        is_valid, errors, _ = data_validator.validate_data(_VALID_CHART, "no_such_schema.json")
+        assert not is_valid
+        assert errors[0].startswith("Unexpected error:")
+
+
+class TestDataValidatorFailFast:
+    """Test cases for fail_fast, which stops at the first error"""
+
+    def test_validate_all_returns_exactly_one_error(self, data_validator):
+        """validate_all(fail_fast=True) stops at the first error of any category"""
+        result = data_validator.validate_all(_INVALID_CHART, "medical_chart.json", fail_fast=True)
+
+        assert result == {"required": ["patient_id"], "types": [], "format": []}
+
+    def test_validate_all_stops_on_first_walk_error(self, data_validator):
+        """With required fields present, the first error found while walking is returned"""
+        data = {**_INVALID_CHART, "patient_id": "PAT001", "provider": "Dr. Smith", "chief_complaint": "Cough"}
+
+        result = data_validator.validate_all(data, "medical_chart.json", fail_fast=True)
+
+        assert result == {
+            "required": [],
+            "types": [],
+            "format": ["Format error at chart_id: value 'CHART-1' does not match pattern '^CHT[0-9]{3,}$'"],
+        }
+
+    @pytest.mark.parametrize("method, expected_error", [
+        pytest.param("validate_required_fields", "patient_id", id="required"),
+        pytest.param("validate_data_types",
+                     "Type mismatch at vital_signs.heart_rate: expected integer, got str", id="types"),
+        pytest.param("validate_format",
+                     "Format error at chart_id: value 'CHART-1' does not match pattern '^CHT[0-9]{3,}$'", id="format"),
+    ])
+    def test_wrapper_stops_on_first_error_in_own_category(self, data_validator, method, expected_error):
+        """Each wrapper stops only on its own category, so other categories' earlier errors don't end it"""
+        check = getattr(data_validator, method)
+
+        assert check(_INVALID_CHART, "medical_chart.json", fail_fast=True) == (False, [expected_error])
+        # Without fail_fast the same first error leads the full list
+        is_valid, errors = check(_INVALID_CHART, "medical_chart.json")
+        assert not is_valid
+        assert errors[0] == expected_error
+        assert len(errors) > 1
+
+    def test_wrapper_ignores_errors_in_other_categories(self, data_validator):
+        """An error in another category must not make a fail_fast wrapper report success early"""
+        data = {**_VALID_CHART, "chart_id": 1001, "visit_date": "yesterday"}
+
+        assert data_validator.validate_format(data, "medical_chart.json", fail_fast=True) == (
+            False, ["Format error at chart_id: value '1001' does not match pattern '^CHT[0-9]{3,}$'"]
+        )
+        assert data_validator.validate_data_types({**_VALID_CHART, "visit_date": "yesterday"},
+                                                  "medical_chart.json", fail_fast=True) == (True, [])
@@ -2,11 +2,103 @@
 Data validation utilities for test suite
 """
 import jsonschema
-from jsonschema import validate, ValidationError
-from typing import Dict, Any, Tuple, List
+from jsonschema.exceptions import ValidationError, relevance
+from jsonschema.validators import validator_for
+from typing import Dict, Any, Iterator, Optional, Tuple, List, Set, Union
+import functools
 import json
+import os
+import re
 from pathlib import Path
 
+# Compiled validators keyed by absolute schema file path, shared by all DataValidator instances
+_VALIDATOR_CACHE: Dict[str, jsonschema.protocols.Validator] = {}
+
+_DATE_RE = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# JSON Schema type name -> accepted Python types
+_TYPE_MAP: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+# Error categories reported by DataValidator.validate_all
+_CATEGORIES = ("required", "types", "format")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema_file(schema_file: str) -> Dict[str, Any]:
+    """Read and parse a schema file once per process; schemas are immutable during a run"""
+    return json.loads(Path(schema_file).read_bytes())
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a schema pattern once; array items sharing a pattern reuse it"""
+    return re.compile(pattern)
+
+
+def _python_types(schema_type: Union[str, List[str]]) -> Optional[Tuple[type, ...]]:
+    """Python types accepted by a schema 'type' (a name or a union list); None if any name is not in _TYPE_MAP"""
+    if isinstance(schema_type, str):
+        return _TYPE_MAP.get(schema_type)
+    try:
+        return tuple(t for name in schema_type for t in _TYPE_MAP[name])
+    except (KeyError, TypeError):
+        return None
+
+
+def _error_fields(error: ValidationError) -> List[str]:
+    """Dotted paths of the fields a validation error is about; "" for the document root"""
+    path = ".".join(str(p) for p in error.absolute_path)
+    if error.validator == "required" and isinstance(error.instance, dict):
+        # 'required' errors sit on the parent object; report the missing children instead
+        prefix = f"{path}." if path else ""
+        return [f"{prefix}{field}" for field in error.validator_value if field not in error.instance]
+    return [path]
+
+
+def _walk_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> Iterator[Tuple[str, Any, Dict[str, Any], str]]:
+    """
+    Iterate depth-first over the data values that have a matching sub-schema
+    
+    Yields ("value", value, property_schema, path) for object properties and
+    ("item", item, items_schema, path) for array elements, in document order.
+    Uses an explicit stack instead of recursion, so deeply nested records do
+    not pay a Python frame per level or risk hitting the recursion limit.
+    """
+    stack = [("object", data, schema, "")]
+    pop, push = stack.pop, stack.append
+    while stack:
+        kind, value, schema_obj, path = pop()
+        if kind == "object":
+            properties = schema_obj.get("properties")
+            # Only dicts have properties to descend into; the type check on the
+            # yielded value reports anything else declared as an object
+            if properties is not None and isinstance(value, dict):
+                # Push in reverse so children pop in document order
+                stack.extend(reversed([
+                    ("value", child, properties[key], f"{path}.{key}" if path else key)
+                    for key, child in value.items() if key in properties
+                ]))
+            continue
+        
+        yield kind, value, schema_obj, path
+        
+        if schema_obj.get("type") == "object":
+            push(("object", value, schema_obj, path))
+        elif kind == "value" and schema_obj.get("type") == "array" and "items" in schema_obj and isinstance(value, list):
+            items_schema = schema_obj["items"]
+            stack.extend(reversed([
+                ("item", item, items_schema, f"{path}[{i}]") for i, item in enumerate(value)
+            ]))
+
 
 class DataValidator:
     """Validates data against JSON schemas"""
@@ -19,7 +111,12 @@ class DataValidator:
             schema_path: Path to directory containing JSON schemas
         """
         self.schema_path = schema_path or Path(__file__).parent.parent / "fixtures" / "schemas"
-        self._schemas = {}
+        # Resolved once here so building cache keys stays a string join, not a filesystem call
+        self._schema_dir = str(self.schema_path.resolve())
+    
+    def _schema_file(self, schema_name: str) -> str:
+        """Absolute path of a schema file, used as the cache key so relative and absolute schema paths share entries"""
+        return f"{self._schema_dir}{os.sep}{schema_name}"
     
     def load_schema(self, schema_name: str) -> Dict[str, Any]:
         """
@@ -31,13 +128,31 @@ class DataValidator:
         Returns:
             Schema dictionary
         """
-        if schema_name not in self._schemas:
-            schema_file = self.schema_path / schema_name
-            with open(schema_file, 'r') as f:
-                self._schemas[schema_name] = json.load(f)
-        return self._schemas[schema_name]
+        return _load_schema_file(self._schema_file(schema_name))
     
-    def validate_data(self, data: Dict[str, Any], schema_name: str) -> Tuple[bool, List[str]]:
+    def get_validator(self, schema_name: str) -> jsonschema.protocols.Validator:
+        """
+        Get the compiled validator for a schema, building it on first use
+        
+        The schema itself is checked against its metaschema only once here,
+        rather than on every validation call.
+        
+        Args:
+            schema_name: Name of schema file
+            
+        Returns:
+            Validator instance for the schema's declared draft
+        """
+        key = self._schema_file(schema_name)
+        validator = _VALIDATOR_CACHE.get(key)
+        if validator is None:
+            schema = self.load_schema(schema_name)
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            validator = _VALIDATOR_CACHE.setdefault(key, validator_class(schema))
+        return validator
+    
+    def validate_data(self, data: Dict[str, Any], schema_name: str) -> Tuple[bool, List[str], Set[str]]:
         """
         Validate data against schema
         
@@ -46,150 +161,169 @@ class DataValidator:
             schema_name: Name of schema file
             
         Returns:
-            Tuple of (is_valid, list_of_errors)
+            Tuple of (is_valid, list_of_errors, failing_fields); errors are ordered
+            most relevant first, failing_fields holds dotted paths of offending fields
+            ("" when the document root itself is invalid, e.g. not an object)
         """
         try:
-            schema = self.load_schema(schema_name)
-            validate(instance=data, schema=schema)
-            return True, []
-        except ValidationError as e:
-            errors = [f"Validation error: {e.message} at path: {'.'.join(str(p) for p in e.path)}"]
-            return False, errors
+            validation_errors = sorted(self.get_validator(schema_name).iter_errors(data), key=relevance, reverse=True)
+            errors = [
+                f"Validation error: {e.message} at path: {'.'.join(str(p) for p in e.path)}"
+                for e in validation_errors
+            ]
+            failing_fields = {field for e in validation_errors for field in _error_fields(e)}
+            return len(errors) == 0, errors, failing_fields
         except Exception as e:
-            return False, [f"Unexpected error: {str(e)}"]
+            return False, [f"Unexpected error: {str(e)}"], set()
     
-    def validate_required_fields(self, data: Dict[str, Any], schema_name: str) -> Tuple[bool, List[str]]:
+    def is_valid(self, data: Dict[str, Any], schema_name: str) -> bool:
+        """
+        Check data against schema, stopping at the first error
+        
+        Cheaper than validate_data when only a pass/fail answer is needed,
+        since no further errors are collected or formatted.
+        
+        Args:
+            data: Data to validate
+            schema_name: Name of schema file
+            
+        Returns:
+            True if data is valid; False if it is not, or if the schema cannot be
+            loaded (as validate_data reports those as errors)
+        """
+        try:
+            return next(self.get_validator(schema_name).iter_errors(data), None) is None
+        except Exception:
+            return False
+    
+    def validate_all(self, data: Dict[str, Any], schema_name: str, fail_fast: bool = False) -> Dict[str, List[str]]:
+        """
+        Run the required-field, type and format checks in a single pass
+        
+        Prefer this over calling validate_required_fields, validate_data_types
+        and validate_format separately: the data is walked once instead of
+        once per check.
+        
+        Args:
+            data: Data to validate
+            schema_name: Name of schema file
+            fail_fast: Stop at the first error of any category
+            
+        Returns:
+            Dict with "required" (missing field names), "types" (type errors)
+            and "format" (format errors) lists
+        """
+        return self._validate_all(data, schema_name, _CATEGORIES, fail_fast)
+    
+    def _validate_all(self, data: Dict[str, Any], schema_name: str, categories: Tuple[str, ...],
+                      fail_fast: bool) -> Dict[str, List[str]]:
+        """Single-pass walk behind validate_all and the per-category wrappers; only the given categories are checked"""
+        schema = self.get_validator(schema_name).schema
+        required_errors = []
+        type_errors = []
+        format_errors = []
+        result = {"required": required_errors, "types": type_errors, "format": format_errors}
+        
+        if "required" in categories:
+            required_errors.extend(field for field in schema.get("required", []) if field not in data)
+            if required_errors and fail_fast:
+                del required_errors[1:]
+                return result
+        
+        check_types = "types" in categories
+        check_format = "format" in categories
+        if not (check_types or check_format):
+            # Required fields are top-level only; no need to walk the data
+            return result
+        
+        add_type_error = type_errors.append
+        add_format_error = format_errors.append
+        
+        for kind, value, prop_schema, path in _walk_schema(data, schema):
+            if check_types and "type" in prop_schema:
+                expected_type = prop_schema["type"]
+                expected_python_types = _python_types(expected_type)
+                # Types this check doesn't know are skipped (validate_data still covers them);
+                # bool subclasses int but is not a JSON integer/number
+                if expected_python_types is not None and (
+                    not isinstance(value, expected_python_types)
+                    or (isinstance(value, bool) and bool not in expected_python_types)
+                ):
+                    actual_type = type(value).__name__
+                    if expected_type == "number":
+                        add_type_error(f"Type mismatch at {path}: expected number (int/float), got {actual_type}")
+                    else:
+                        if isinstance(expected_type, list):
+                            expected_type = " or ".join(expected_type)
+                        add_type_error(f"Type mismatch at {path}: expected {expected_type}, got {actual_type}")
+                    if fail_fast:
+                        return result
+            
+            if not check_format:
+                continue
+            
+            if "pattern" in prop_schema:
+                pattern = prop_schema["pattern"]
+                if not _compile(pattern).match(str(value)):
+                    add_format_error(f"Format error at {path}: value '{value}' does not match pattern '{pattern}'")
+                    if fail_fast:
+                        return result
+            
+            # 'format' is only checked on object properties, not array items
+            if kind == "value" and "format" in prop_schema:
+                format_type = prop_schema["format"]
+                if format_type == "date" and not _DATE_RE.match(str(value)):
+                    add_format_error(f"Date format error at {path}: expected YYYY-MM-DD, got '{value}'")
+                    if fail_fast:
+                        return result
+                elif format_type == "email" and not _EMAIL_RE.match(str(value)):
+                    add_format_error(f"Email format error at {path}: invalid email format '{value}'")
+                    if fail_fast:
+                        return result
+        
+        return result
+    
+    def validate_required_fields(self, data: Dict[str, Any], schema_name: str, fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate that all required fields are present
         
         Args:
             data: Data to validate
             schema_name: Name of schema file
+            fail_fast: Stop at the first error instead of collecting all
             
         Returns:
             Tuple of (all_present, list_of_missing_fields)
         """
-        schema = self.load_schema(schema_name)
-        required_fields = schema.get("required", [])
-        missing_fields = [field for field in required_fields if field not in data]
-        
-        if missing_fields:
-            return False, missing_fields
-        return True, []
+        missing_fields = self._validate_all(data, schema_name, ("required",), fail_fast)["required"]
+        return len(missing_fields) == 0, missing_fields
     
-    def validate_data_types(self, data: Dict[str, Any], schema_name: str) -> Tuple[bool, List[str]]:
+    def validate_data_types(self, data: Dict[str, Any], schema_name: str, fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate data types match schema
         
         Args:
             data: Data to validate
             schema_name: Name of schema file
+            fail_fast: Stop at the first error instead of collecting all
             
         Returns:
             Tuple of (all_valid, list_of_type_errors)
         """
-        schema = self.load_schema(schema_name)
-        errors = []
-        
-        def check_type(value, schema_prop, path=""):
-            if "type" in schema_prop:
-                expected_type = schema_prop["type"]
-                actual_type = type(value).__name__
-                
-                type_map = {
-                    "string": "str",
-                    "integer": "int",
-                    "number": ("int", "float"),
-                    "boolean": "bool",
-                    "array": "list",
-                    "object": "dict"
-                }
-                
-                expected_python_type = type_map.get(expected_type)
-                if expected_type == "number":
-                    if actual_type not in expected_python_type:
-                        errors.append(f"Type mismatch at {path}: expected number (int/float), got {actual_type}")
-                elif actual_type != expected_python_type:
-                    errors.append(f"Type mismatch at {path}: expected {expected_type}, got {actual_type}")
-        
-        def validate_recursive(data_obj, schema_obj, path=""):
-            if "properties" in schema_obj:
-                for key, value in data_obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if key in schema_obj["properties"]:
-                        prop_schema = schema_obj["properties"][key]
-                        check_type(value, prop_schema, current_path)
-                        
-                        if prop_schema.get("type") == "object" and "properties" in prop_schema:
-                            validate_recursive(value, prop_schema, current_path)
-                        elif prop_schema.get("type") == "array" and "items" in prop_schema:
-                            if isinstance(value, list):
-                                for i, item in enumerate(value):
-                                    item_path = f"{current_path}[{i}]"
-                                    if prop_schema["items"].get("type") == "object":
-                                        validate_recursive(item, prop_schema["items"], item_path)
-                                    else:
-                                        check_type(item, prop_schema["items"], item_path)
-        
-        validate_recursive(data, schema)
+        errors = self._validate_all(data, schema_name, ("types",), fail_fast)["types"]
         return len(errors) == 0, errors
     
-    def validate_format(self, data: Dict[str, Any], schema_name: str) -> Tuple[bool, List[str]]:
+    def validate_format(self, data: Dict[str, Any], schema_name: str, fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate data format (dates, patterns, etc.)
         
         Args:
             data: Data to validate
             schema_name: Name of schema file
+            fail_fast: Stop at the first error instead of collecting all
             
         Returns:
             Tuple of (all_valid, list_of_format_errors)
         """
-        schema = self.load_schema(schema_name)
-        errors = []
-        
-        def validate_pattern(value, pattern, path):
-            import re
-            if not re.match(pattern, str(value)):
-                errors.append(f"Format error at {path}: value '{value}' does not match pattern '{pattern}'")
-        
-        def validate_format_value(value, format_type, path):
-            if format_type == "date":
-                import re
-                date_pattern = r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$"
-                if not re.match(date_pattern, str(value)):
-                    errors.append(f"Date format error at {path}: expected YYYY-MM-DD, got '{value}'")
-            elif format_type == "email":
-                import re
-                email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                if not re.match(email_pattern, str(value)):
-                    errors.append(f"Email format error at {path}: invalid email format '{value}'")
-        
-        def validate_recursive(data_obj, schema_obj, path=""):
-            if "properties" in schema_obj:
-                for key, value in data_obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if key in schema_obj["properties"]:
-                        prop_schema = schema_obj["properties"][key]
-                        
-                        if "pattern" in prop_schema:
-                            validate_pattern(value, prop_schema["pattern"], current_path)
-                        
-                        if "format" in prop_schema:
-                            validate_format_value(value, prop_schema["format"], current_path)
-                        
-                        if prop_schema.get("type") == "object" and "properties" in prop_schema:
-                            validate_recursive(value, prop_schema, current_path)
-                        elif prop_schema.get("type") == "array" and "items" in prop_schema:
-                            if isinstance(value, list):
-                                for i, item in enumerate(value):
-                                    item_path = f"{current_path}[{i}]"
-                                    item_schema = prop_schema["items"]
-                                    if "pattern" in item_schema:
-                                        validate_pattern(item, item_schema["pattern"], item_path)
-                                    if item_schema.get("type") == "object":
-                                        validate_recursive(item, item_schema, item_path)
-        
-        validate_recursive(data, schema)
+        errors = self._validate_all(data, schema_name, ("format",), fail_fast)["format"]
         return len(errors) == 0, errors
-